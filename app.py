@@ -1,15 +1,17 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import yfinance as yf
-import plotly.express as px
-import plotly.graph_objects as go
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from streamlit_calendar import calendar
 from supabase import create_client, Client
 
 # --- 1. APP CONFIG & STYLING ---
 st.set_page_config(page_title="Thinkzella", layout="wide")
+LOG_PAGE_SIZE = 50  # Trade Log rows per page
 
 # --- 2. SUPABASE CONNECTION ---
 # Ensure these are set in Streamlit Cloud > Settings > Secrets
@@ -22,40 +24,217 @@ except Exception as e:
     st.stop()
 
 # --- 3. DATABASE ENGINE ---
+SIDE_SIGN = {"Long": 1, "Short": -1}
+# Column types for the trades table, applied in one astype() after loading
+TRADE_DTYPES = {
+    "ticker": "category", "type": "category", "setup": "category", "mistake": "category", "status": "category",
+    "entry": "float64", "exit": "float64", "quantity": "float64", "p_l": "float64",
+}
+
+@st.cache_data(ttl=60, show_spinner=False)
 def load_data():
-    """Fetches all trades from Supabase."""
-    try:
-        response = supabase.table("trades").select("*").order("date", desc=True).execute()
-        df = pd.DataFrame(response.data)
-        if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-        return df
-    except Exception as e:
-        st.error(f"Database Error: {e}")
-        return pd.DataFrame()
-
-def delete_trade(trade_id):
-    """Removes a trade from Supabase by ID."""
-    supabase.table("trades").delete().eq("id", trade_id).execute()
-
-# Fetch data for the session
-all_trades = load_data()
-
-# --- 4. SIDEBAR ---
+    """Fetches all trades from Supabase, oldest first. Cached until a write or the TTL."""
+    response = supabase.table("trades").select("*").order("date").order("id").execute()
+    df = pd.DataFrame(response.data)
+    if not df.empty:
+        df['date'] = pd.to_datetime(df['date'], format="ISO8601")
+        # A timestamptz column comes back with an offset; keep dates naive (UTC) so NumPy casts downstream work
+        if df['date'].dt.tz is not None: df['date'] = df['date'].dt.tz_convert(None)
+        # Older rows may carry stray spaces or casing; normalize once so each label is one category
+        df['ticker'] = df['ticker'].str.strip().str.upper()
+        df['type'] = df['type'].str.strip().str.capitalize()
+        # Low-cardinality labels become categoricals: groupbys and filters then run on integer codes
+        df = df.astype(TRADE_DTYPES)
+        # Prices and sizes drop to float32 only when every value round-trips exactly; p_l stays float64 for the running sums
+        for c in ("entry", "exit", "quantity"):
+            narrow = df[c].astype("float32")
+            if (narrow.astype("float64") == df[c]).all(): df[c] = narrow
+        # Rows arrive sorted by date, so the equity curve is a plain running sum
+        df['equity'] = df['p_l'].to_numpy().cumsum()
+        df['abs_pl'] = df['p_l'].abs()
+        df['win'] = df['status'].eq('Win')
+    return df
+
+def delete_trades(trade_ids):
+    """Removes trades from Supabase by ID in a single request."""
+    supabase.table("trades").delete().in_("id", trade_ids).execute()
+    load_data.clear()
+
+@st.cache_resource
+def background_pool():
+    """Worker threads for network calls that shouldn't hold up a rerun."""
+    return ThreadPoolExecutor(max_workers=4)
+
+def insert_trade(new_data):
+    """Queues a trade insert; it is settled by flush_pending_writes() on a later rerun."""
+    fut = background_pool().submit(lambda: supabase.table("trades").insert(new_data).execute())
+    st.session_state.setdefault("pending_writes", []).append((fut, new_data))
+
+def flush_pending_writes(wait=True):
+    """Settles queued inserts, invalidating the trade cache; returns the saved trades and (trade, error) failures."""
+    pending = st.session_state.get("pending_writes", [])
+    done = [w for w in pending if wait or w[0].done()]
+    if not done: return [], []
+    st.session_state["pending_writes"] = [w for w in pending if w not in done]
+    load_data.clear()
+    saved, failed = [], []
+    for fut, trade in done:
+        try:
+            fut.result()
+            saved.append(trade)
+        except Exception as e:
+            failed.append((trade, e))
+    return saved, failed
+
+@st.cache_data(show_spinner=False)
+def last_trade_by_ticker(df):
+    """Maps each ticker to its most recent trade."""
+    return df.drop_duplicates("ticker", keep="last").set_index("ticker").to_dict("index")
+
+@st.cache_data(show_spinner=False)
+def daily_pnl(df):
+    """Sums P&L per calendar day, grouping on datetime64[D] keys instead of Python dates."""
+    day = df['date'].to_numpy().astype('datetime64[D]')
+    return pd.Series(df['p_l'].to_numpy()).groupby(day, sort=False).sum()
+
+# --- 4. MARKET DATA ---
+CACHE_DIR = Path(".cache")
+OHLC = ["Open", "High", "Low", "Close"]
+# Journal tickers Yahoo quotes as <TICKER>-USD
+CRYPTO = {"BTC", "ETH", "SOL", "BNB", "XRP", "ADA"}
+
+def _cached_download(symbol, start, end, interval="1d"):
+    """Downloads OHLC bars from Yahoo, persisting closed windows to a local Parquet cache."""
+    key = hashlib.sha1(f"{symbol}|{start}|{end}|{interval}|unadjusted".encode()).hexdigest()
+    path = CACHE_DIR / f"{key}.parquet"
+    if path.exists():
+        try:
+            return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+        except Exception:
+            # A truncated or corrupt file would otherwise fail every later read; drop it and download again
+            path.unlink(missing_ok=True)
+    import yfinance as yf
+    if " " in symbol:
+        h = yf.download(symbol, start=start, end=end, interval=interval, auto_adjust=False, progress=False)[OHLC]
+    else:
+        h = yf.Ticker(symbol).history(start=start, end=end, interval=interval, actions=False, auto_adjust=False).reindex(columns=OHLC)
+        # An empty result comes back with a plain index, which has no timezone to drop
+        if isinstance(h.index, pd.DatetimeIndex): h.index = h.index.tz_localize(None)
+    # end is exclusive, so a window ending today or earlier holds only closed daily bars and can be persisted
+    if not h.empty and end <= datetime.now().date().isoformat():
+        # Write to a temp file and rename it into place, so an interrupted write never leaves a partial file at path
+        tmp = None
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            os.close(fd)
+            h.to_parquet(tmp, engine="pyarrow", compression="zstd")
+            os.replace(tmp, path)
+        except OSError:
+            # The cache is best-effort: a full disk only costs a re-download next time
+            if tmp: Path(tmp).unlink(missing_ok=True)
+    return h
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_history(symbol, start, end, interval="1d"):
+    """In-process cache on top of the on-disk download cache, with flat OHLC columns."""
+    h = _cached_download(symbol, start, end, interval)
+    if h.columns.nlevels > 1: h.columns = h.columns.get_level_values(0)
+    return h
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def prefetch_history(symbols, start, end, interval="1d"):
+    """Downloads all symbols in batches of 20 and returns one OHLC frame per symbol."""
+    batches = [symbols[i:i + 20] for i in range(0, len(symbols), 20)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = list(pool.map(lambda b: _cached_download(" ".join(b), start, end, interval), batches))
+    history = {}
+    for batch, h in zip(batches, frames):
+        if h.empty: continue
+        for sym in batch:
+            if h.columns.nlevels > 1:
+                if sym not in h.columns.get_level_values(1): continue
+                sub = h.xs(sym, axis=1, level=1)
+            else:
+                sub = h
+            # The batch is aligned on the union of trading days, so drop the gaps
+            sub = sub.iloc[~np.isnan(sub[OHLC].to_numpy()).any(axis=1)]
+            if not sub.empty: history[sym] = sub
+    return history
+
+def yf_symbol(tick):
+    """Maps a journal ticker to its Yahoo Finance symbol."""
+    return f"{tick}-USD" if tick in CRYPTO else tick
+
+def history_window(df):
+    """Symbols and date range prefetch_history() covers for the whole journal, ending no later than today."""
+    # Clamping keeps the window stable across same-day inserts and lets the batch reach the disk cache
+    return (
+        tuple(sorted({yf_symbol(t) for t in df['ticker'].cat.categories})),
+        (df['date'].iloc[0] - timedelta(days=30)).date().isoformat(),
+        min(df['date'].iloc[-1] + timedelta(days=15), pd.Timestamp(datetime.now().date())).date().isoformat(),
+    )
+
+# --- 5. CHARTS ---
+# Shared layout for Trade Analysis candlesticks, passed straight to go.Figure()
+CANDLE_LAYOUT = {"template": "plotly_dark", "xaxis_rangeslider_visible": False}
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the shape of (x, y)."""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    # n_out - 2 buckets between the fixed first and last points
+    bounds = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    bounds[-1] = n - 1
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        nxt = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x, avg_y = x[hi:nxt].mean(), y[hi:nxt].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+# --- 6. SIDEBAR ---
 st.sidebar.title("💎 Thinkzella")
 st.sidebar.caption("© 2026 Th!nkSolution")
 
-with st.sidebar.expander("🧮 Risk Calculator"):
-    acc = st.number_input("Balance ($)", value=10000.0)
-    risk_pct = st.number_input("Risk (%)", value=1.0)
-    ent_p = st.number_input("Entry Price", value=0.0)
-    sl_p = st.number_input("Stop Loss", value=0.0)
-    if ent_p > 0 and sl_p > 0 and ent_p != sl_p:
-        st.success(f"Size: {(acc * (risk_pct/100)) / abs(ent_p - sl_p):.4f}")
+@st.fragment
+def risk_calculator():
+    """Position-size calculator; editing its inputs reruns only this fragment."""
+    with st.expander("🧮 Risk Calculator"):
+        acc = st.number_input("Balance ($)", value=10000.0)
+        risk_pct = st.number_input("Risk (%)", value=1.0)
+        ent_p = st.number_input("Entry Price", value=0.0)
+        sl_p = st.number_input("Stop Loss", value=0.0)
+        if ent_p > 0 and sl_p > 0 and ent_p != sl_p:
+            st.success(f"Size: {(acc * (risk_pct/100)) / abs(ent_p - sl_p):.4f}")
+
+with st.sidebar:
+    risk_calculator()
 
 menu = st.sidebar.radio("Navigation", ["Dashboard", "Calendar", "Trade Log", "Manual Entry", "Trade Analysis", "Deep Statistics"])
 
-# --- 5. NAVIGATION LOGIC ---
+# Report queued inserts as they settle; Manual Entry never reads trades, so it doesn't wait on them
+saved, failed = flush_pending_writes(wait=menu != "Manual Entry")
+for trade in saved:
+    st.toast(f"Trade Permanently Saved! ({trade['ticker']} {trade['date']})")
+for trade, e in failed:
+    st.error(f"Trade was not saved: {trade['type']} {trade['quantity']:g} {trade['ticker']} on {trade['date']} @ {trade['entry']:g} -> {trade['exit']:g} ({e})")
+
+# Fetch data for the session (errors are raised outside the cache so they are not memoized)
+try:
+    all_trades = load_data()
+except Exception as e:
+    st.error(f"Database Error: {e}")
+    all_trades = pd.DataFrame()
+
+# --- 7. NAVIGATION LOGIC ---
 
 if menu == "Manual Entry":
     st.title("📝 New Journal Entry")
@@ -63,9 +242,9 @@ if menu == "Manual Entry":
         c1, c2, c3 = st.columns(3)
         with c1:
             d = st.date_input("Trade Date", datetime.now())
-            t = st.text_input("Ticker (e.g. BTC, TSLA)").upper()
+            t = st.text_input("Ticker (e.g. BTC, TSLA)").strip().upper()
         with c2:
-            tp = st.selectbox("Type", ["Long", "Short"])
+            tp = st.selectbox("Type", list(SIDE_SIGN))
             en = st.number_input("Entry Price", format="%.4f")
         with c3:
             ex = st.number_input("Exit Price", format="%.4f")
@@ -76,14 +255,13 @@ if menu == "Manual Entry":
         notes = st.text_area("Journal Notes")
         
         if st.form_submit_button("Sync to Supabase"):
-            pl = (ex - en) * q * (1 if tp == "Long" else -1)
+            pl = (ex - en) * q * SIDE_SIGN[tp]
             new_data = {
                 "date": str(d), "ticker": t, "type": tp, "entry": en, 
                 "exit": ex, "quantity": q, "setup": setup, "mistake": mistake, 
                 "notes": notes, "p_l": float(pl), "status": "Win" if pl > 0 else "Loss"
             }
-            supabase.table("trades").insert(new_data).execute()
-            st.success("Trade Permanently Saved!")
+            insert_trade(new_data)
             st.rerun()
 
 elif menu == "Dashboard":
@@ -91,60 +269,106 @@ elif menu == "Dashboard":
     if all_trades.empty:
         st.info("No trades found in Supabase.")
     else:
+        pl = all_trades['p_l'].to_numpy()
         c1, c2, c3 = st.columns(3)
-        c1.metric("Net P&L", f"${all_trades['p_l'].sum():,.2f}")
-        win_rate = (len(all_trades[all_trades['p_l'] > 0]) / len(all_trades) * 100)
+        c1.metric("Net P&L", f"${pl.sum():,.2f}")
+        win_rate = np.count_nonzero(pl > 0) / pl.size * 100
         c2.metric("Win Rate", f"{win_rate:.1f}%")
-        c3.metric("Total Trades", len(all_trades))
+        c3.metric("Total Trades", pl.size)
         
-        df_plot = all_trades.sort_values("date")
-        df_plot["Equity"] = df_plot["p_l"].cumsum()
-        st.plotly_chart(px.area(df_plot, x="date", y="Equity", template="plotly_dark", color_discrete_sequence=['#00ffcc']), use_container_width=True)
+        # The canvas is ~1000px wide, so cap what gets shipped to the browser
+        keep = lttb(all_trades["date"].to_numpy().astype("int64"), all_trades["equity"].to_numpy(), 2000)
+        st.area_chart(all_trades.iloc[keep].set_index("date")["equity"].rename("Equity"), color="#00ffcc")
 
 elif menu == "Trade Log":
     st.title("📜 Permanent Trade Log")
     if all_trades.empty:
         st.info("Database is empty.")
     else:
-        for _, row in all_trades.iterrows():
-            with st.expander(f"{row['date'].date()} | {row['ticker']} | {row['status']} (${row['p_l']:.2f})"):
-                st.write(f"**Strategy:** {row['setup']} | **Mistake:** {row['mistake']}")
-                st.write(f"**Notes:** {row['notes']}")
-                if st.button("Delete Permanently", key=f"del_{row['id']}"):
-                    delete_trade(row['id'])
-                    st.rerun()
+        # Newest first, one page at a time so only that slice is serialized to the browser
+        pages = -(-len(all_trades) // LOG_PAGE_SIZE)
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1)
+        log = all_trades.iloc[::-1].iloc[(page - 1) * LOG_PAGE_SIZE:page * LOG_PAGE_SIZE]
+        # One editable table for the page; ticking Delete marks rows for a single batch delete
+        view = log[['id', 'date', 'ticker', 'type', 'status', 'p_l', 'setup', 'mistake', 'notes']].assign(delete=False)
+        edited = st.data_editor(
+            view,
+            column_config={
+                "id": None, "date": st.column_config.DateColumn("Date"),
+                "p_l": st.column_config.NumberColumn("P&L", format="$%.2f"), "delete": st.column_config.CheckboxColumn("Delete"),
+            },
+            disabled=view.columns.drop("delete").tolist(), use_container_width=True, hide_index=True, key=f"log_editor_{page}"
+        )
+        ids = edited.loc[edited['delete'], 'id'].tolist()
+        if st.button(f"Delete {len(ids)} Selected Permanently", disabled=not ids):
+            delete_trades(ids)
+            # Row edits are positional, so drop them before the shortened page renders
+            del st.session_state[f"log_editor_{page}"]
+            st.rerun()
+
+        # Warm the market-data cache for Trade Analysis without holding up this page
+        window = history_window(all_trades)
+        if st.session_state.get("prefetched_window") != window:
+            background_pool().submit(prefetch_history, *window)
+            st.session_state["prefetched_window"] = window
 
 elif menu == "Trade Analysis":
     st.title("📊 Technical Analysis")
     if all_trades.empty:
         st.warning("No data.")
     else:
-        tick = st.selectbox("Select Ticker", all_trades["ticker"].unique())
-        tr = all_trades[all_trades["ticker"] == tick].iloc[0]
+        # load_data() stores ticker as a categorical, so its categories are the distinct tickers
+        tickers = all_trades["ticker"].cat.categories
+        tick = st.selectbox("Select Ticker", tickers)
+        tr = last_trade_by_ticker(all_trades)[tick]
         
-        yf_t = f"{tick}-USD" if tick in ["BTC", "ETH", "SOL"] else tick
-        try:
-            h = yf.download(yf_t, start=tr['date']-timedelta(days=20), end=tr['date']+timedelta(days=5))
-            if not h.empty:
-                if isinstance(h.columns, pd.MultiIndex): h.columns = h.columns.get_level_values(0)
-                h = h.reset_index()
-                fig = go.Figure(data=[go.Candlestick(x=h['Date'], open=h['Open'], high=h['High'], low=h['Low'], close=h['Close'])])
-                
-                # Risk/Reward Dotted Line
-                fig.add_shape(type="line", x0=tr['date'], y0=tr['entry'], x1=tr['date'], y1=tr['exit'], line=dict(color="white", dash="dot"))
-                fig.add_annotation(x=tr['date'], y=tr['entry'], text="BUY", bgcolor="#00ffcc", font=dict(color="black"))
-                fig.add_annotation(x=tr['date'], y=tr['exit'], text="SELL", bgcolor="#ff4b4b")
-                
-                fig.update_layout(template="plotly_dark", xaxis_rangeslider_visible=False)
-                st.plotly_chart(fig, use_container_width=True)
-            else: st.error("No market data found.")
-        except Exception as e: st.error(f"Candle Error: {e}")
+        # Unrelated widget interactions rerun the page; only rebuild the chart when the trade changes
+        sig = (tick, tr['date'], tr['entry'], tr['exit'])
+        if st.session_state.get("chart_sig") != sig:
+            st.session_state.pop("chart_fig", None)
+            st.session_state.pop("chart_sig", None)
+            yf_t = yf_symbol(tick)
+            try:
+                # One batched download covers every ticker's closed bars; selections just slice it
+                window = history_window(all_trades)
+                history = prefetch_history(*window)
+                start = (tr['date'] - timedelta(days=20)).date().isoformat()
+                end = (tr['date'] + timedelta(days=5)).date().isoformat()
+                # Trades from the last few days reach past the batch, so they fetch their own window with the live bar
+                if yf_t in history and end <= window[2]:
+                    h = history[yf_t].loc[start:end]
+                else:
+                    h = fetch_history(yf_t, start, end)
+                if not h.empty:
+                    import plotly.graph_objects as go
+                    h = h.reset_index()
+                    fig = go.Figure(data=[go.Candlestick(x=h['Date'], open=h['Open'], high=h['High'], low=h['Low'], close=h['Close'])], layout=CANDLE_LAYOUT)
+                    
+                    # Risk/Reward dotted line with BUY/SELL markers, drawn as WebGL traces rather than SVG shapes
+                    x, y = [tr['date'], tr['date']], [tr['entry'], tr['exit']]
+                    fig.add_trace(go.Scattergl(x=x, y=y, mode="lines", line=dict(color="white", dash="dot"), showlegend=False, hoverinfo="skip"))
+                    fig.add_trace(go.Scattergl(
+                        x=x, y=y, mode="markers+text", text=["BUY", "SELL"], textposition=["top right", "bottom right"],
+                        marker=dict(color=["#00ffcc", "#ff4b4b"], size=10), showlegend=False
+                    ))
+
+                    st.session_state["chart_fig"] = fig
+                    st.session_state["chart_sig"] = sig
+                else: st.error("No market data found.")
+            except Exception as e: st.error(f"Candle Error: {e}")
+        if "chart_fig" in st.session_state:
+            st.plotly_chart(st.session_state["chart_fig"], use_container_width=True, key=f"chart_{tick}")
 
 elif menu == "Calendar":
     st.title("Daily P&L Calendar")
     if not all_trades.empty:
-        daily = all_trades.groupby(all_trades['date'].dt.date)['p_l'].sum().reset_index()
-        evts = [{"title": f"${r['p_l']:.0f}", "start": str(r['date']), "backgroundColor": "#2ecc71" if r['p_l'] >= 0 else "#e74c3c"} for _, r in daily.iterrows()]
+        daily = daily_pnl(all_trades)
+        pl = daily.to_numpy()
+        dates = daily.index.to_numpy().astype('datetime64[D]').astype(str)
+        colors = np.where(pl >= 0, "#2ecc71", "#e74c3c")
+        titles = np.char.add("$", np.round(pl).astype(int).astype(str))
+        evts = [{"title": t, "start": d, "backgroundColor": c, "borderColor": c, "allDay": True} for t, d, c in zip(titles, dates, colors)]
+        from streamlit_calendar import calendar
         calendar(events=evts, options={"initialView": "dayGridMonth"})
 
 elif menu == "Deep Statistics":
@@ -153,16 +377,17 @@ elif menu == "Deep Statistics":
     if all_trades.empty:
         st.info("No data available in Supabase. Log some trades to see your deep stats.")
     else:
+        import plotly.express as px
+
         # 1. Strategy Efficiency Table
         st.subheader("Strategy Performance Report")
-        # Aggregating data based on Supabase column names
-        stats = all_trades.groupby("setup").agg({
-            'p_l': ['sum', 'count', 'mean'],
-            'status': lambda x: (x == 'Win').sum()
+        # One named aggregation feeds both the table and the setup bar chart
+        stats = all_trades.groupby("setup", observed=True, sort=False).agg(**{
+            'Total P&L': ('p_l', 'sum'),
+            'Trade Count': ('p_l', 'count'),
+            'Average P&L': ('p_l', 'mean'),
+            'Wins': ('win', 'sum'),
         })
-        
-        # Cleaning up the multi-index columns
-        stats.columns = ['Total P&L', 'Trade Count', 'Average P&L', 'Wins']
         stats['Win Rate'] = (stats['Wins'] / stats['Trade Count'] * 100).map('{:.1f}%'.format)
         
         # Display the table with color formatting
@@ -173,11 +398,12 @@ elif menu == "Deep Statistics":
         
         with col1:
             st.subheader("Profitability by Setup")
+            setup_pl = stats['Total P&L']
             setup_fig = px.bar(
-                all_trades.groupby("setup")["p_l"].sum().reset_index(),
-                x="setup", 
-                y="p_l", 
-                color="p_l",
+                x=setup_pl.index, 
+                y=setup_pl.values, 
+                color=setup_pl.values,
+                labels={'x': 'setup', 'y': 'p_l', 'color': 'p_l'},
                 color_continuous_scale='RdYlGn',
                 template="plotly_dark"
             )
@@ -186,10 +412,10 @@ elif menu == "Deep Statistics":
         with col2:
             st.subheader("Mistake Distribution")
             # Analyze which mistakes are costing the most money
+            mistake_pl = all_trades.groupby('mistake', observed=True, sort=False)['abs_pl'].sum()
             mistake_fig = px.pie(
-                all_trades, 
-                values=all_trades['p_l'].abs(), 
-                names='mistake',
+                values=mistake_pl.values, 
+                names=mistake_pl.index,
                 hole=0.4,
                 template="plotly_dark",
                 color_discrete_sequence=px.colors.sequential.Reds_r
@@ -198,15 +424,17 @@ elif menu == "Deep Statistics":
 
         # 3. Ticker Heatmap
         st.subheader("Ticker Volume vs. Profit")
+        ticker_stats = all_trades.groupby("ticker", observed=True, sort=False).agg({'p_l': 'sum', 'quantity': 'count'})
         ticker_fig = px.scatter(
-            all_trades.groupby("ticker").agg({'p_l': 'sum', 'quantity': 'count'}).reset_index(),
+            ticker_stats,
             x="quantity",
             y="p_l",
             size="quantity",
             color="p_l",
-            text="ticker",
+            text=ticker_stats.index,
             labels={'quantity': 'Number of Trades', 'p_l': 'Total Profit/Loss'},
-            template="plotly_dark"
+            template="plotly_dark",
+            render_mode="webgl"
         )
         st.plotly_chart(ticker_fig, use_container_width=True)
 